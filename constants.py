@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import NamedTuple
 
 
@@ -9,9 +10,9 @@ class FormsWord(NamedTuple):
 
 class Const(frozenset):
     # Класс-контейнер для констант. Наследуется от frozenset для неизменяемости.
-    NAME_UI = "_internal\\report.ui"  # Путь к файлу UI, сформированному Qt Designer
-    PERCENT_CORP = 50.0  # Процент отчислений корпорации
-    PERCENT_NDS = 22.0  # Процент НДС, заданный по умолчанию.
+    NAME_UI = "_internal/report.ui"  # Путь к файлу UI, сформированному Qt Designer (Windows и Linux)
+    PERCENT_CORP = Decimal("50.0")  # Процент отчислений корпорации
+    PERCENT_NDS = Decimal("22.0")  # Процент НДС, заданный по умолчанию.
     TIME_TO_SHOW_SUCCESS_MS = 1000  # Время показа успешного уведомления (мс)
     TIME_TO_SHOW_FAILURE_MS = 5000  # Время показа уведомления об ошибке (мс)
     STYLE_INPUT = """
@@ -19,6 +20,9 @@ class Const(frozenset):
             color: #0000ff;            /* Цвет текста */
         """  # Стиль для полей ввода (CSS)
     STYLE_ERROR = "background-color: #ffe6e6;"  # Стиль дл ошибочных данных
+    FONT_SIZE_INPUT = 10  # Размер шрифта полей ввода, создаваемых программно
+    TEXT_PAID_SAMPLE = "12345678.90"  # Образец суммы, по которому рассчитывается минимальная ширина поля платежа
+    PAID_WIDTH_MARGIN = 16  # Запас ширины поля платежа на рамку и внутренние отступы (px)
     # Регулярное выражение для контроля ввода плавающих чисел:
     # — Пробелы в начале и конце выражения допустимы
     # — Целая часть: цифры, апострофы и пробелы
@@ -32,12 +36,21 @@ class Const(frozenset):
         "’",
     )  # Символы для удаления из введённой строки
     LANG = "ru"  # Обозначение языка вывода
+    # Граница быстрого пути (float) для сумм. До 10^12 float хранит копейки с большим запасом точности,
+    # крупные суммы обрабатываются точно в Decimal.
+    FLOAT_EXACT_LIMIT = 1e12
+    DECIMAL_KOPECK = Decimal("0.01")  # Шаг округления Decimal до копеек
+    DECIMAL_ZERO = Decimal("0.00")  # Нулевая сумма
+    # Запас точности Decimal сверх старшего разряда суммы: единицы рублей, 2 разряда копеек
+    # и резерв на умножение на проценты и деление при вычислении НДС
+    DECIMAL_EXTRA_DIGITS = 12
     FORMS_RUBLE = FormsWord(
         genitive_plural="рублей", nominative="рубль", genitive="рубля"
     )  # Склонения слова "рубль"
     TEXT_KOP = "коп"  # Сокращение для слова копеек
     TEXT_RUB = "руб"  # Сокращение для слова рублей
     TEXT_INCLUDING_NDS = "включая НДС"
+    TEXT_INPUT_PAID = "Введите сумму платежа"  # Подсказка для поля ввода платежа
     TEXT_WRITTEN_IN_CLIPBOARD = "Текст скопирован в буфер обмена"
     TEXT_NO_WRITTEN_IN_CLIPBOARD = "Текст НЕ СКОПИРОВАН в буфер обмена"
     TEXT_ERROR_PRG = (
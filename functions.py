@@ -1,3 +1,6 @@
+import re
+from decimal import Context, Decimal, InvalidOperation, getcontext, localcontext
+
 from PyQt6.QtWidgets import QLineEdit, QApplication, QMessageBox
 from PyQt6.QtCore import QTimer
 
@@ -22,12 +25,12 @@ def filter_rubles(input_str: str) -> str:
     return input_str
 
 
-def put_line_input(line_edit: QLineEdit, rubles: float) -> None:
+def put_line_input(line_edit: QLineEdit, rubles: float | Decimal) -> None:
     """
     Выводит в виджет жирным шрифтом отформатированную сумму
     Args:
         line_edit (QLineEdit): Виджет ввода суммы
-        rubles (float): сумма
+        rubles (float | Decimal): сумма
 
     Returns: None
     """
@@ -61,21 +64,103 @@ def parse_rubles(rubles_str: str) -> float | None:
         return None
 
 
-def summa_to_words(summa: float) -> str:
+def parse_rubles_decimal(rubles_str: str) -> Decimal | None:
+    """
+    Преобразует сумму в рублях (str) в Decimal без потери точности при любой величине суммы.
+    Используется для крупных (например, сводных) сумм, на которых float теряет копейки.
+    В отличие от parse_rubles, не выводит окно сообщения об ошибке: функция предназначена и для
+    пакетной обработки, некорректный ввод обрабатывает вызывающий код.
+
+    Args:
+        rubles_str (str): Строка, содержащая сумму в рублях. В строке возможны "лишние" символы: апострофы
+                          и любые пробельные символы (в том числе неразрывный пробел из Word и Excel)
+
+    Returns:
+        Decimal: Сумма в рублях, округлённая до 2 десятичных знаков.
+                 Возвращает None, если ввод не соответствует C.RE_INPUT_DOUBLE (в том числе знак, экспонента, NaN).
+    """
+    cleaned_str = re.sub(r"\s", "", filter_rubles(rubles_str))
+    if not cleaned_str:
+        return Decimal("0.00")
+    if not re.match(C.RE_INPUT_DOUBLE, cleaned_str):
+        return None
+    try:
+        return quantize_kopecks(Decimal(cleaned_str))
+    except InvalidOperation:
+        return None
+
+
+def kopeck_context(summa: Decimal) -> Context:
+    """
+    Возвращает контекст Decimal с точностью, достаточной для суммы summa с копейками.
+
+    Args:
+        summa (Decimal): Сумма денег.
+
+    Returns:
+        Context: Контекст для localcontext(). Точность не ниже текущей.
+    """
+    context = getcontext().copy()
+    context.prec = max(context.prec, summa.adjusted() + C.DECIMAL_EXTRA_DIGITS)
+    return context
+
+
+def quantize_kopecks(summa: Decimal) -> Decimal:
+    """
+    Округляет сумму до копеек без ограничения величины суммы точностью контекста Decimal.
+
+    Args:
+        summa (Decimal): Сумма денег.
+
+    Returns:
+        Decimal: Сумма, округлённая до 2 десятичных знаков.
+    """
+    with localcontext(kopeck_context(summa)):
+        return summa.quantize(C.DECIMAL_KOPECK)
+
+
+def split_summa(summa: float | Decimal) -> tuple[int, int]:
+    """
+    Разделяет сумму на рубли и копейки. Знак копеек совпадает со знаком суммы.
+
+    Быстрый путь - float по модулю меньше C.FLOAT_EXACT_LIMIT, на котором float точно хранит копейки.
+    Медленный путь - точные вычисления в Decimal для крупных сумм и сумм типа Decimal.
+    Оба пути округляют сумму до копеек (половина - к чётному) и только потом разделяют её,
+    поэтому, например, 1.996 даёт 2 рубля 00 копеек.
+
+    Args:
+        summa (float | Decimal): Сумма денег.
+
+    Returns:
+        tuple[int, int]: Рубли и копейки.
+    """
+    if isinstance(summa, float) and -C.FLOAT_EXACT_LIMIT < summa < C.FLOAT_EXACT_LIMIT:
+        total_kopecks = round(summa * 100)
+    else:
+        # Decimal(float) - точное двоичное значение, как и при форматировании в summa_format
+        exact = summa if isinstance(summa, Decimal) else Decimal(summa)
+        with localcontext(kopeck_context(exact)):
+            total_kopecks = int(exact.quantize(C.DECIMAL_KOPECK).scaleb(2))
+
+    if total_kopecks >= 0:
+        return total_kopecks // 100, total_kopecks % 100
+    total_kopecks = -total_kopecks
+    return -(total_kopecks // 100), -(total_kopecks % 100)
+
+
+def summa_to_words(summa: float | Decimal) -> str:
     """
     Преобразует сумму в текстовое представление на русском языке с правильным склонением слова "рубль".
 
     Args:
-        summa (float): Сумма денег, которую нужно преобразовать в слова.
+        summa (float | Decimal): Сумма денег, которую нужно преобразовать в слова.
 
     Returns:
         str: Строковое представление суммы с рублями и копейками.
     """
 
-    # Получаем целую часть суммы (рубли)
-    rubles = int(summa)
-    # Получаем дробную часть суммы (копейки), округляя до ближайшего целого
-    kopecks = round((summa - rubles) * 100)
+    # Получаем целую часть суммы (рубли) и дробную часть (копейки), округлённую до ближайшего целого
+    rubles, kopecks = split_summa(summa)
 
     # Преобразуем рубли в слова и делаем первую букву заглавной
     rubles_word = num2words(rubles, lang=C.LANG).capitalize()
@@ -99,12 +184,12 @@ def summa_to_words(summa: float) -> str:
     return f"{rubles_word} {ruble_declension} {kopecks:02} {C.TEXT_KOP}."
 
 
-def show_summa(summa: float) -> str:
+def show_summa(summa: float | Decimal) -> str:
     """
     Формирует строку, состоящую из цифрового и текстового представления суммы в рублях и копейках.
 
     Args:
-        summa (float): Сумма денег, которую нужно отобразить.
+        summa (float | Decimal): Сумма денег, которую нужно отобразить.
 
     Returns:
         str: Строковое представление суммы в цифрах и в рублях и копейках.
@@ -112,39 +197,53 @@ def show_summa(summa: float) -> str:
     return f"{summa_format(summa)} {C.TEXT_RUB}. ({summa_to_words(summa)})"
 
 
-def summa_format(summa: float) -> str:
+def summa_format(summa: float | Decimal) -> str:
+    """Форматирует сумму с 2 десятичными знаками. Для Decimal форматирование точное при любой величине суммы."""
     return f"{summa:.2f}"
 
 
 # noinspection PyPep8Naming
-def extract_NDS(summa: float, percent_NDS: float) -> float:
+def extract_NDS(
+        summa: float | Decimal, percent_NDS: float | Decimal
+) -> float | Decimal:
     """
     Вычленяет НДС из суммы.
 
     Формула: НДС = сумма * процент / (100 + процент)
 
     Args:
-        summa (float): Исходная сумма.
-        percent_NDS (float): процент НДС
+        summa (float | Decimal): Исходная сумма.
+        percent_NDS (float | Decimal): процент НДС
 
     Returns:
-        float: Вычлененная сумма НДС.
+        float | Decimal: Вычлененная сумма НДС. Для суммы типа Decimal вычисления выполняются в Decimal.
     """
+    if isinstance(summa, Decimal):
+        percent = (
+            percent_NDS
+            if isinstance(percent_NDS, Decimal)
+            else Decimal(repr(percent_NDS))
+        )
+        with localcontext(kopeck_context(summa)):
+            return summa * percent / (100 + percent)
     return summa * percent_NDS / (100 + percent_NDS)
 
 
 # noinspection PyPep8Naming
 def display_summa(
-        r_edit_line: QLineEdit, summa: float, NDS_including: bool, percent_NDS: float
+        r_edit_line: QLineEdit,
+        summa: float | Decimal,
+        NDS_including: bool,
+        percent_NDS: float | Decimal,
 ) -> None:
     """
     Устанавливает текст в r_edit_line, устанавливает позицию курсора для более читабельного отображения информации.
 
     Args:
         r_edit_line (QLineEdit): Поле для отображения суммы
-        summa (float): Сумма денег.
+        summa (float | Decimal): Сумма денег.
         NDS_including (bool): Признак того, что в сумму входит НДС
-        percent_NDS (float) : процент НДС
+        percent_NDS (float | Decimal) : процент НДС
     """
 
     r_edit_line.setText(format_summa_and_NDS(summa, NDS_including, percent_NDS))
@@ -152,14 +251,16 @@ def display_summa(
 
 
 # noinspection PyPep8Naming
-def format_summa_and_NDS(summa: float, NDS_including: bool, percent_NDS: float) -> str:
+def format_summa_and_NDS(
+        summa: float | Decimal, NDS_including: bool, percent_NDS: float | Decimal
+) -> str:
     """
     Форматирует текст суммы и НДС.
 
     Args:
-        summa (float): Сумма денег.
+        summa (float | Decimal): Сумма денег.
         NDS_including (bool): Признак того, что в сумму входит НДС
-        percent_NDS (float) : процент НДС
+        percent_NDS (float | Decimal) : процент НДС
 
     Returns:
         Отформатированный текст
@@ -0,0 +1,82 @@
+from decimal import Decimal
+from fractions import Fraction
+from typing import Hashable, Iterable
+
+
+class Payments:
+    """
+    Класс-модель списка платежей в корпорацию произвольной длины.
+    Хранит платежи в копейках (int) и поддерживает нарастающий итог,
+    который обновляется при каждом добавлении, изменении или удалении платежа за O(1),
+    без повторного суммирования всего списка.
+    Платежи адресуются ключами (например, виджетами ввода), поэтому удаление
+    платежа из середины списка не требует сдвига остальных элементов.
+    """
+
+    def __init__(self) -> None:
+        self._kopecks: dict[Hashable, int] = {}  # Платежи в копейках по ключам
+        self._total_kopecks = 0  # Нарастающий итог платежей в копейках
+
+    @classmethod
+    def from_amounts(cls, amounts: Iterable[float | Decimal]) -> "Payments":
+        """
+        Создаёт список платежей из произвольного количества сумм.
+
+        Args:
+            amounts (Iterable[float | Decimal]): Суммы платежей в рублях.
+
+        Returns:
+            Payments: Список платежей. Ключи платежей - порядковые номера сумм.
+        """
+        payments = cls()
+        for key, amount in enumerate(amounts):
+            payments.set(key, amount)
+        return payments
+
+    def set(self, key: Hashable, amount: float | Decimal) -> None:
+        """
+        Добавляет платёж или изменяет сумму существующего платежа.
+
+        Args:
+            key (Hashable): Ключ платежа.
+            amount (float | Decimal): Сумма платежа в рублях.
+        """
+        kopecks = to_kopecks(amount)
+        self._total_kopecks += kopecks - self._kopecks.get(key, 0)
+        self._kopecks[key] = kopecks
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Удаляет платёж. Отсутствующий ключ игнорируется.
+
+        Args:
+            key (Hashable): Ключ платежа.
+        """
+        self._total_kopecks -= self._kopecks.pop(key, 0)
+
+    @property
+    def total(self) -> Decimal:
+        """Сумма всех платежей в рублях, точная при любой величине."""
+        # Decimal из строки создаётся точно, без округления до точности контекста
+        return Decimal(f"{self._total_kopecks}E-2")
+
+    def __len__(self) -> int:
+        return len(self._kopecks)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._kopecks
+
+
+def to_kopecks(rubles: float | Decimal) -> int:
+    """
+    Переводит сумму в рублях в целое число копеек.
+
+    Args:
+        rubles (float | Decimal): Сумма в рублях.
+
+    Returns:
+        int: Сумма в копейках. Decimal переводится точно, в целых числах.
+    """
+    if isinstance(rubles, Decimal):
+        return round(Fraction(rubles) * 100)
+    return round(rubles * 100)
@@ -0,0 +1,154 @@
+"""
+Общие средства для тестов и замеров производительности интерфейса Report.
+
+Тесты выполняются без дисплея (платформа Qt "offscreen"). Окно Report создаётся
+один раз за сеанс и переиспользуется всеми тестами, поэтому UI загружается только один раз.
+"""
+
+import os
+import statistics
+import time
+import unittest
+from functools import cache
+
+# Платформа должна быть задана до создания QApplication
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget  # noqa: E402
+from PyQt6.QtCore import QEvent, QObject, Qt  # noqa: E402
+from PyQt6.QtTest import QTest  # noqa: E402
+
+from constants import Const as C  # noqa: E402
+from report import Report  # noqa: E402
+from validatedlineedit import ValidatedLineEdit  # noqa: E402
+
+LATENCY_TIMEOUT_S = 1.0  # Предельное ожидание перерисовки после правки (с)
+
+
+@cache
+def get_app() -> QApplication:
+    """Возвращает единственный на сеанс экземпляр QApplication."""
+    app = QApplication.instance()
+    return app if isinstance(app, QApplication) else QApplication([])
+
+
+@cache
+def get_window() -> Report:
+    """Возвращает окно Report, общее для всех тестов сеанса."""
+    get_app()
+    window = Report()
+    window.show()
+    QTest.qWaitForWindowActive(window)
+    return window
+
+
+def enter_text(line_edit: ValidatedLineEdit, text: str) -> None:
+    """
+    Имитирует ввод значения пользователем: фокус на поле, ввод текста, уход из поля.
+
+    Args:
+        line_edit (ValidatedLineEdit): Поле ввода.
+        text (str): Вводимый текст.
+    """
+    QApplication.processEvents()  # Показ виджетов, добавленных в макет, выполняется через очередь событий
+    line_edit.setFocus()
+    line_edit.setText(text)
+    line_edit.clearFocus()
+
+
+def reset_window(window: Report) -> None:
+    """
+    Возвращает окно в исходное состояние: пустые суммы, один пустой платёж, НДС по умолчанию.
+
+    Args:
+        window (Report): Окно, состояние которого сбрасывается.
+    """
+    # Окно могло потерять активность (например, из-за всплывающего сообщения)
+    window.activateWindow()
+    QTest.qWaitForWindowActive(window)
+    for index in reversed(range(window.layoutPaid.count())):
+        enter_text(window.layoutPaid.itemAt(index).widget(), "")
+    enter_text(window.EditClientsNDS, "")
+    enter_text(window.EditPercent_NDS, f"{C.PERCENT_NDS}")
+    # Удаляем виджеты платежей, помеченные deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+class ReportTestCase(unittest.TestCase):
+    """Базовый класс тестов Report: окно общее для всего сеанса, перед каждым тестом оно сбрасывается."""
+
+    window: Report
+
+    @classmethod
+    def setUpClass(cls):
+        cls.window = get_window()
+
+    def setUp(self):
+        reset_window(self.window)
+
+
+class PaintProbe(QObject):
+    """Фильтр событий, фиксирующий время первой перерисовки наблюдаемого виджета."""
+
+    def __init__(self, widget: QWidget) -> None:
+        super().__init__(widget)
+        self.painted_at: float | None = None  # Время перерисовки (time.perf_counter)
+        widget.installEventFilter(self)
+
+    def eventFilter(self, source: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+        return super().eventFilter(source, event)
+
+
+def measure_latency(window: Report, edits: int) -> list[float]:
+    """
+    Замеряет задержку интерфейса "потеря фокуса -> перерисовка поля результата" для серии правок.
+    Уход из поля выполняется нажатием Tab (QTest), перерисовка ожидается в цикле обработки событий.
+    Правки чередуются между полем суммы клиентов и полем первого платежа.
+
+    Args:
+        window (Report): Окно, в котором выполняются правки.
+        edits (int): Количество правок.
+
+    Returns:
+        list[float]: Задержка каждой правки в мс.
+    """
+    QApplication.processEvents()
+    pairs = (  # Поле ввода и поле результата, изменяемое правкой
+        (window.EditClientsNDS, PaintProbe(window.rEditClients)),
+        (window.layoutPaid.itemAt(0).widget(), PaintProbe(window.rEditPaid)),
+    )
+    latencies = []
+    for edit in range(edits):
+        line_edit, probe = pairs[edit % len(pairs)]
+        line_edit.setFocus()
+        line_edit.setText(f"{edit * 37 % 1_000_000}.{edit % 100:02}")
+        QApplication.processEvents()  # Завершаем перерисовку после ввода текста
+
+        probe.painted_at = None
+        start = time.perf_counter()
+        QTest.keyClick(line_edit, Qt.Key.Key_Tab)
+        deadline = start + LATENCY_TIMEOUT_S
+        while probe.painted_at is None and time.perf_counter() < deadline:
+            QApplication.processEvents()
+        end = probe.painted_at if probe.painted_at is not None else time.perf_counter()
+        latencies.append((end - start) * 1000)
+
+    for _, probe in pairs:
+        probe.deleteLater()
+    return latencies
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """
+    Вычисляет перцентиль выборки.
+
+    Args:
+        values (list[float]): Выборка, не менее 2 значений.
+        percent (int): Перцентиль, от 1 до 99.
+
+    Returns:
+        float: Значение перцентиля.
+    """
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
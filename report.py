@@ -1,13 +1,23 @@
 import sys
+from decimal import localcontext
 from pathlib import Path
 import typing
 
 from PyQt6 import uic
-from PyQt6.QtWidgets import QMainWindow, QLineEdit, QApplication
+from PyQt6.QtWidgets import (
+    QMainWindow,
+    QLineEdit,
+    QApplication,
+    QScrollArea,
+    QWidget,
+    QHBoxLayout,
+)
 from PyQt6 import QtCore
+from PyQt6.QtCore import Qt, QTimer
 
 import functions as f
 from constants import Const as C
+from payments import Payments
 from validatedlineedit import ValidatedLineEdit
 
 
@@ -18,9 +28,6 @@ class OutputAN(typing.NamedTuple):
 
 class Report(QMainWindow):
     EditClientsNDS: ValidatedLineEdit
-    EditPaid_1: ValidatedLineEdit
-    EditPaid_2: ValidatedLineEdit
-    EditPaid_3: ValidatedLineEdit
     EditPercent_NDS: ValidatedLineEdit
     rEditClientsNDS: QLineEdit
     rEditClients: QLineEdit
@@ -29,23 +36,24 @@ class Report(QMainWindow):
     rEditLeft: QLineEdit
     rEditOver: QLineEdit
     rEditPaid: QLineEdit
+    scrollPaid: QScrollArea
+    PaidContainer: QWidget
+    layoutPaid: QHBoxLayout
 
     def __init__(self) -> None:
         """Инициализация UI, атрибутов и подключение сигналов."""
         super().__init__()
         self.init_UI()  # Инициализация UI, подготовленного Qt Designer, в том числе установка атрибутов полей
 
-        # Атрибуты хранят финансовые данные
-        self.clients_nds = 0.0  # Заплачено клиентами с НДС
-        self.clients = 0.0  # Заплачено клиентами без НДС
-        self.corp = 0.0  # Подлежит перечислению в корпорацию без НДС
-        self.corp_nds = 0.0  # В корпорацию, включая НДС
-        self.left = 0.0  # Осталось заплатить, включая НДС
-        self.over = 0.0  # Переплачено, включая НДС
-        self.paid = 0.0  # Заплачено, включая НДС
-        self.paid_1 = 0.0  # Первый платёж, включая НДС
-        self.paid_2 = 0.0  # Второй платёж, включая НДС
-        self.paid_3 = 0.0  # Третий платёж, включая НДС
+        # Атрибуты хранят финансовые данные (Decimal - без потери копеек на крупных суммах)
+        self.clients_nds = C.DECIMAL_ZERO  # Заплачено клиентами с НДС
+        self.clients = C.DECIMAL_ZERO  # Заплачено клиентами без НДС
+        self.corp = C.DECIMAL_ZERO  # Подлежит перечислению в корпорацию без НДС
+        self.corp_nds = C.DECIMAL_ZERO  # В корпорацию, включая НДС
+        self.left = C.DECIMAL_ZERO  # Осталось заплатить, включая НДС
+        self.over = C.DECIMAL_ZERO  # Переплачено, включая НДС
+        self.paid = C.DECIMAL_ZERO  # Заплачено, включая НДС
+        self.payments = Payments()  # Платежи в корпорацию, включая НДС
         self.percent_NDS = (
             C.PERCENT_NDS
         )  # Процент НДС корпорации. C.PERCENT_NDS - значение по умолчанию.
@@ -55,6 +63,7 @@ class Report(QMainWindow):
         self.setup_connections()  # Установка соединений сигналов и слотов
         self.set_event_filters()  # Установка фильтров событий для полей вывода
         self.set_custom_interface()  # Настройка внешнего вида интерфейса
+        self.add_paid_line_edit()  # Создание поля ввода первого платежа
 
     def init_UI(self) -> None:
         """Загрузка UI и атрибутов полей в объект класса"""
@@ -118,17 +127,19 @@ class Report(QMainWindow):
         Вычисляет основные финансовые показатели на основе введенных данных:
         - Сумма для корпорации без НДС.
         - Сумма для корпорации с НДС.
-        - Общая сумма платежей.
+        - Общая сумма платежей (берётся из нарастающего итога).
         - Остаток платежей.
+        Вычисления выполняются в Decimal с точностью, достаточной для наибольшей из сумм.
         """
-        nds_clients = self.clients_nds * self.percent_NDS / (100 + self.percent_NDS)
-        self.clients = round(self.clients_nds - nds_clients, 2)
-        self.corp = round(self.clients * C.PERCENT_CORP / 100, 2)
-        # noinspection PyPep8Naming
-        nds_corp = self.corp * self.percent_NDS / 100
-        self.corp_nds = round(self.corp + nds_corp, 2)
-        self.paid = round(self.paid_1 + self.paid_2 + self.paid_3, 2)
-        self.left = round(self.corp_nds - self.paid, 2)
+        self.paid = self.payments.total  # Нарастающий итог, без суммирования всех платежей
+        with localcontext(f.kopeck_context(max(self.clients_nds, self.paid))):
+            nds_clients = f.extract_NDS(self.clients_nds, self.percent_NDS)
+            self.clients = f.quantize_kopecks(self.clients_nds - nds_clients)
+            self.corp = f.quantize_kopecks(self.clients * C.PERCENT_CORP / 100)
+            # noinspection PyPep8Naming
+            nds_corp = self.corp * self.percent_NDS / 100
+            self.corp_nds = f.quantize_kopecks(self.corp + nds_corp)
+            self.left = f.quantize_kopecks(self.corp_nds - self.paid)
 
     def analysis_compute(self) -> None:
         """
@@ -137,9 +148,9 @@ class Report(QMainWindow):
         """
         if self.left < 0:
             self.over = -self.left
-            self.left = 0.0
+            self.left = C.DECIMAL_ZERO
         else:
-            self.over = 0.0
+            self.over = C.DECIMAL_ZERO
 
     def display(self) -> None:
         """
@@ -157,17 +168,84 @@ class Report(QMainWindow):
 
     def handler_signal_focus_out(self, obj: ValidatedLineEdit) -> None:
         """Обработчик сигнала выхода из фокуса поля ввода"""
-        input_summa = f.parse_rubles(obj.text())
+        input_summa = f.parse_rubles_decimal(obj.text())
+        if input_summa is None:  # Поле уже отмечено как ошибочное (ValidatedLineEdit), значение не меняется
+            return
         setattr(self, self.input_line_edits[obj], input_summa)
         f.put_line_input(obj, input_summa)
         self.compute_and_display()
 
+    def handler_signal_focus_out_paid(self, obj: ValidatedLineEdit) -> None:
+        """
+        Обработчик сигнала выхода из фокуса поля ввода платежа.
+        Заполненное последнее поле порождает новое пустое поле, очищенное поле (кроме последнего) удаляется.
+        """
+        is_last = self.layoutPaid.indexOf(obj) == self.layoutPaid.count() - 1
+        if not f.filter_rubles(obj.text()):
+            self.payments.remove(obj)
+            if not is_last:
+                self.remove_paid_line_edit(obj)
+            self.compute_and_display()
+            return
+
+        input_summa = f.parse_rubles_decimal(obj.text())
+        if input_summa is None:  # Поле уже отмечено как ошибочное (ValidatedLineEdit), значение не меняется
+            return
+        self.payments.set(obj, input_summa)
+        f.put_line_input(obj, input_summa)
+        if is_last:
+            line_edit = self.add_paid_line_edit()
+            if obj.focus_out_reason == Qt.FocusReason.TabFocusReason:
+                # Переход по Tab из заполненного поля - в новое поле (после обработки текущей смены фокуса)
+                QTimer.singleShot(0, line_edit.setFocus)
+        self.compute_and_display()
+
+    def add_paid_line_edit(self) -> ValidatedLineEdit:
+        """
+        Создаёт новое поле ввода платежа в конце прокручиваемого списка платежей.
+        Returns:
+            ValidatedLineEdit: Созданное поле ввода
+        """
+        line_edit = ValidatedLineEdit(self.PaidContainer)
+        line_edit.setToolTip(C.TEXT_INPUT_PAID)
+        line_edit.setPlaceholderText(C.TEXT_INPUT_PAID)
+        font = line_edit.font()
+        font.setPointSize(C.FONT_SIZE_INPUT)
+        line_edit.setFont(font)
+        f.set_bold_font(line_edit)
+        f.set_style_input(line_edit)
+        # Поля не сжимаются ниже ширины типичной суммы - при переполнении появляется полоса прокрутки
+        line_edit.setMinimumWidth(
+            line_edit.fontMetrics().horizontalAdvance(C.TEXT_PAID_SAMPLE)
+            + C.PAID_WIDTH_MARGIN
+        )
+        line_edit.signal_focus_out.connect(self.handler_signal_focus_out_paid)
+
+        # Порядок Tab: предыдущее поле (последний платёж или "Клиенты") -> новое поле -> % НДС
+        count = self.layoutPaid.count()
+        previous = self.layoutPaid.itemAt(count - 1).widget() if count else self.EditClientsNDS
+        QWidget.setTabOrder(previous, line_edit)
+        QWidget.setTabOrder(line_edit, self.EditPercent_NDS)
+        self.layoutPaid.addWidget(line_edit)
+        line_edit.show()
+        self.scrollPaid.ensureWidgetVisible(line_edit)
+        return line_edit
+
+    def remove_paid_line_edit(self, line_edit: ValidatedLineEdit) -> None:
+        """Удаляет поле ввода платежа (кроме последнего) из прокручиваемого списка платежей"""
+        index = self.layoutPaid.indexOf(line_edit)
+        previous = self.layoutPaid.itemAt(index - 1).widget() if index else self.EditClientsNDS
+        following = self.layoutPaid.itemAt(index + 1).widget()
+
+        # Поле исключается из порядка Tab сразу, не дожидаясь удаления виджета
+        line_edit.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.layoutPaid.removeWidget(line_edit)
+        QWidget.setTabOrder(previous, following)
+        line_edit.deleteLater()
+
     def _get_dict_input(self) -> dict:
         return {  # Словарь свойств виджетов ввода
             self.EditClientsNDS: "clients_nds",  # Поле ввода. "Клиенты" - Cумма, заплаченная клиентами (без НДС).
-            self.EditPaid_1: "paid_1",  # Поле ввода. "Оплачено" - Сумма первого платежа в корпорацию.
-            self.EditPaid_2: "paid_2",  # Поле ввода. "Оплачено" - Сумма второго платежа в корпорацию.
-            self.EditPaid_3: "paid_3",  # Поле ввода. "Оплачено" - Сумма третьего платежа в корпорацию.
             self.EditPercent_NDS: "percent_NDS",  # Процент НДС, применяемый корпорацией.
         }  # Виджеты для ввода информации
 
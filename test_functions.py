@@ -1,11 +1,15 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 from functions import (
     filter_rubles,
     parse_rubles,
+    parse_rubles_decimal,
+    split_summa,
     summa_to_words,
+    summa_format,
     extract_NDS,
-    show_amount,
+    show_summa,
 )
 
 
@@ -64,15 +68,15 @@ class TestFunctions(unittest.TestCase):
             "Минус один миллион двести тридцать четыре тысячи пятьсот шестьдесят семь рублей -13 коп.",
         )
 
-    def test_show_amount(self):
+    def test_show_summa(self):
         # Стандартные суммы
         self.assertEqual(
-            show_amount(1234.56),
+            show_summa(1234.56),
             "1234.56 руб. (Одна тысяча двести тридцать четыре рубля 56 коп.)",
         )
         # Пограничные случаи
-        self.assertEqual(show_amount(0.0), "0.00 руб. (Ноль рублей 00 коп.)")
-        self.assertEqual(show_amount(1.0145), "1.01 руб. (Один рубль 01 коп.)")
+        self.assertEqual(show_summa(0.0), "0.00 руб. (Ноль рублей 00 коп.)")
+        self.assertEqual(show_summa(1.0145), "1.01 руб. (Один рубль 01 коп.)")
 
     def test_parse_rubles_edge_cases(self):
         # Точки в начале и конце
@@ -97,6 +101,76 @@ class TestFunctions(unittest.TestCase):
             "Минус одна тысяча двести тридцать четыре рубля -56 коп.",
         )
 
+    def test_parse_rubles_decimal(self):
+        self.assertEqual(parse_rubles_decimal("1'234.567"), Decimal("1234.57"))
+        self.assertEqual(parse_rubles_decimal(""), Decimal("0.00"))
+        # Крупные суммы без потери копеек
+        self.assertEqual(
+            parse_rubles_decimal("1 000 000 000 000 000 000.01"),
+            Decimal("1000000000000000000.01"),
+        )
+        self.assertEqual(
+            parse_rubles_decimal("123456789012345678901234567.89"),
+            Decimal("123456789012345678901234567.89"),
+        )
+        # Любые пробельные символы как разделители разрядов (текст из Word и Excel)
+        self.assertEqual(parse_rubles_decimal("1\xa0000.50"), Decimal("1000.50"))
+        self.assertEqual(parse_rubles_decimal("1\t000.50"), Decimal("1000.50"))
+        self.assertEqual(parse_rubles_decimal("12\u202f345.67"), Decimal("12345.67"))
+        # Ввод, не соответствующий формату поля ввода
+        self.assertIsNone(parse_rubles_decimal(".123."))
+        self.assertIsNone(parse_rubles_decimal("nan"))
+        self.assertIsNone(parse_rubles_decimal("inf"))
+        self.assertIsNone(parse_rubles_decimal("-1e3"))
+
+    def test_split_summa(self):
+        # Быстрый путь (float)
+        self.assertEqual(split_summa(1234.56), (1234, 56))
+        self.assertEqual(split_summa(-1234567.127), (-1234567, -13))
+        # Медленный путь (крупный float и Decimal)
+        self.assertEqual(split_summa(12345678901234.57), (12345678901234, 57))
+        self.assertEqual(
+            split_summa(Decimal("1000000000000000000.01")), (10**18, 1)
+        )
+        self.assertEqual(split_summa(Decimal("-1234567.127")), (-1234567, -13))
+        # Округление до копеек с переносом в рубли одинаково на обоих путях
+        self.assertEqual(split_summa(1.996), (2, 0))
+        self.assertEqual(split_summa(Decimal("1.996")), (2, 0))
+        self.assertEqual(split_summa(-1.996), (-2, 0))
+        self.assertEqual(split_summa(1e13 + 0.996), (10**13 + 1, 0))
+        # Суммы, превышающие точность контекста Decimal по умолчанию (28 знаков)
+        self.assertEqual(split_summa(Decimal("1e26")), (10**26, 0))
+        self.assertEqual(
+            split_summa(Decimal("123456789012345678901234567890.125")),
+            (123456789012345678901234567890, 12),
+        )
+
+    def test_large_summa(self):
+        # Суммы, на которых float теряет копейки
+        summa = Decimal("1000000000000000001.99")
+        self.assertEqual(summa_format(summa), "1000000000000000001.99")
+        self.assertEqual(
+            summa_to_words(summa), "Один квинтиллион один рубль 99 коп."
+        )
+        self.assertEqual(
+            summa_to_words(Decimal("22000000000000000.02")),
+            "Двадцать два квадриллиона рублей 02 коп.",
+        )
+        self.assertEqual(
+            extract_NDS(Decimal("122000000000000000.00"), 22.0),
+            Decimal("22000000000000000"),
+        )
+        self.assertEqual(
+            show_summa(Decimal("1e30")),
+            "1000000000000000000000000000000.00 руб. (Один нониллион рублей 00 коп.)",
+        )
+        self.assertEqual(
+            summa_format(
+                extract_NDS(Decimal("122000000000000000000000000000000.61"), 22.0)
+            ),
+            "22000000000000000000000000000000.11",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+import os
+import timeit
+import unittest
+
+from functions import split_summa
+
+# Параметры замера задаются переменными окружения (например, на CI)
+NUMBER = int(os.environ.get("GALAXY_BENCH_NUMBER", 100_000))  # Вызовов в одном замере
+REPEAT = int(os.environ.get("GALAXY_BENCH_REPEAT", 9))  # Количество замеров
+# Быстрый путь сравнивается с прежней реализацией (TOLERANCE = 1.0) с двумя допусками:
+# OVERHEAD_MARGIN - цена проверки типа и границы C.FLOAT_EXACT_LIMIT и переноса копеек в рубли,
+#   около 50 нс на вызов (+15% к прежним двум строкам). В summa_to_words это незаметно
+#   на фоне num2words (около 15 мкс на вызов).
+# NOISE_MARGIN - допуск на шум замеров времени на общей машине CI.
+TOLERANCE = float(os.environ.get("GALAXY_BENCH_TOLERANCE", 1.0))
+OVERHEAD_MARGIN = float(os.environ.get("GALAXY_BENCH_OVERHEAD_MARGIN", 0.2))
+NOISE_MARGIN = float(os.environ.get("GALAXY_BENCH_NOISE_MARGIN", 0.1))
+
+SMALL_SUMMAS = [i * 37.01 % 1_000_000 for i in range(100)]  # Типичные суммы отчёта
+
+
+def split_summa_float(summa: float) -> tuple[int, int]:
+    """Прежнее разделение суммы на рубли и копейки (только float) - эталон скорости."""
+    rubles = int(summa)
+    return rubles, round((summa - rubles) * 100)
+
+
+def best_times(*funcs) -> list[float]:
+    """
+    Лучшее время NUMBER вызовов каждой функции на SMALL_SUMMAS из REPEAT замеров.
+    Замеры функций чередуются, чтобы фоновая нагрузка влияла на них одинаково.
+    """
+
+    def runner(func):
+        def run() -> None:
+            for summa in SMALL_SUMMAS:
+                func(summa)
+
+        return run
+
+    runs = [runner(func) for func in funcs]
+    times = [float("inf")] * len(funcs)
+    for _ in range(REPEAT):
+        for index, run in enumerate(runs):
+            elapsed = timeit.timeit(run, number=NUMBER // len(SMALL_SUMMAS))
+            times[index] = min(times[index], elapsed)
+    return times
+
+
+class TestFunctionsBenchmark(unittest.TestCase):
+    def test_same_result(self):
+        for summa in SMALL_SUMMAS:
+            self.assertEqual(split_summa(summa), split_summa_float(summa))
+
+    def test_small_summa_fast_path(self):
+        # Быстрый путь для небольших сумм не медленнее прежней реализации сверх заявленного допуска
+        current, reference = best_times(split_summa, split_summa_float)
+        self.assertLessEqual(
+            current,
+            reference * (TOLERANCE + OVERHEAD_MARGIN + NOISE_MARGIN),
+            f"split_summa: {current * 1e9 / NUMBER:.0f} нс/вызов, "
+            f"прежняя реализация: {reference * 1e9 / NUMBER:.0f} нс/вызов",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from decimal import Decimal
+
+from payments import Payments, to_kopecks
+
+
+class TestPayments(unittest.TestCase):
+    def test_to_kopecks(self):
+        self.assertEqual(to_kopecks(1234.56), 123456)
+        self.assertEqual(to_kopecks(0.1), 10)
+        self.assertEqual(to_kopecks(0.0), 0)
+        # Decimal переводится точно при любой величине суммы
+        self.assertEqual(
+            to_kopecks(Decimal("123456789012345678901234567890.01")),
+            12345678901234567890123456789001,
+        )
+        self.assertEqual(to_kopecks(Decimal("0.125")), 12)
+
+    def test_set_and_total(self):
+        payments = Payments()
+        self.assertEqual(payments.total, Decimal("0.00"))
+
+        payments.set("a", 0.1)
+        payments.set("b", 0.2)
+        self.assertEqual(payments.total, Decimal("0.30"))
+        self.assertEqual(len(payments), 2)
+
+        # Изменение существующего платежа
+        payments.set("a", 10.5)
+        self.assertEqual(payments.total, Decimal("10.70"))
+        self.assertEqual(len(payments), 2)
+
+    def test_remove(self):
+        payments = Payments.from_amounts([100.0, 200.0, 300.0])
+        payments.remove(1)
+        self.assertEqual(payments.total, 400.0)
+        self.assertNotIn(1, payments)
+
+        # Отсутствующий ключ игнорируется
+        payments.remove(1)
+        self.assertEqual(payments.total, 400.0)
+
+    def test_many_payments(self):
+        # Количество платежей не ограничено, итог не накапливает ошибок округления
+        payments = Payments.from_amounts([0.01] * 10000)
+        self.assertEqual(len(payments), 10000)
+        self.assertEqual(payments.total, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,44 +1,28 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
-from PyQt6.QtWidgets import QApplication, QLineEdit
+
+from qt_harness import ReportTestCase, enter_text
+from PyQt6.QtWidgets import QApplication, QLineEdit, QWidget
 from PyQt6.QtTest import QTest
 from PyQt6.QtCore import Qt
 
-from report import Report
+from constants import Const as C
 from validatedlineedit import ValidatedLineEdit
 
 
-class TestReport(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # Инициализация QApplication (обязательно для работы с Qt)
-        cls.app = QApplication([])
-
-    def setUp(self):
-        # Создаем экземпляр окна перед каждым тестом
-        self.window = Report()
-        self.window.show()
-
-    def tearDown(self):
-        # Закрываем окно после каждого теста
-        self.window.close()
-
+class TestReport(ReportTestCase):
     def test_input_validation_and_display(self):
         # Находим нужные виджеты.
-        clients_widget = self.window.findChild(ValidatedLineEdit, "EditClients")
+        clients_widget = self.window.findChild(ValidatedLineEdit, "EditClientsNDS")
         total_clients_widget = self.window.findChild(QLineEdit, "rEditClients")
         corporation_without_NDS_widget = self.window.findChild(QLineEdit, "rEditCorp")
         corporation_with_NDS_widget = self.window.findChild(QLineEdit, "rEditCorpNDS")
         left_widget = self.window.findChild(QLineEdit, "rEditLeft")
         over_widget = self.window.findChild(QLineEdit, "rEditOver")
 
-        # Установка значений с отладочной печатью
-        clients_widget.setText("100")
-
-        QApplication.processEvents()
-
-        # Обрабатываем события приложения
-        QApplication.processEvents()
+        # Ввод значения с выходом из поля
+        enter_text(clients_widget, "122")
 
         # Проверяем результаты
         self.assertEqual(
@@ -50,17 +34,37 @@ class TestReport(unittest.TestCase):
         )
         self.assertEqual(
             corporation_with_NDS_widget.text(),
-            "60.00 руб. (Шестьдесят рублей 00 коп.), включая НДС 10.00 руб. (Десять рублей 00 коп.)",
+            "61.00 руб. (Шестьдесят один рубль 00 коп.), включая НДС 11.00 руб. (Одиннадцать рублей 00 коп.)",
         )
         self.assertEqual(
             left_widget.text(),
-            "60.00 руб. (Шестьдесят рублей 00 коп.), включая НДС 10.00 руб. (Десять рублей 00 коп.)",
+            "61.00 руб. (Шестьдесят один рубль 00 коп.), включая НДС 11.00 руб. (Одиннадцать рублей 00 коп.)",
         )
         self.assertEqual(
             over_widget.text(),
             "0.00 руб. (Ноль рублей 00 коп.), включая НДС 0.00 руб. (Ноль рублей 00 коп.)",
         )
 
+    def test_large_summa(self):
+        # Сводные суммы свыше 10^16 обрабатываются без потери копеек
+        enter_text(self.window.EditClientsNDS, "12 345 678 901 234 567.89")
+        self.assertEqual(self.window.EditClientsNDS.text(), "12345678901234567.89")
+        self.assertTrue(
+            self.window.rEditClientsNDS.text().startswith(
+                "12345678901234567.89 руб. (Двенадцать квадриллионов "
+            )
+        )
+        self.assertIn(
+            "пятьсот шестьдесят семь рублей 89 коп.)", self.window.rEditClientsNDS.text()
+        )
+        # 12345678901234567.89 / 1.22 = 10119408935438170.40...; 50% = 5059704467719085.20; +22%
+        self.assertEqual(self.window.corp_nds, Decimal("6172839450617283.94"))
+
+        payment = self.window.layoutPaid.itemAt(0).widget()
+        enter_text(payment, "6172839450617283.93")
+        self.assertEqual(self.window.paid, Decimal("6172839450617283.93"))
+        self.assertEqual(self.window.left, Decimal("0.01"))
+
     @patch("PyQt6.QtWidgets.QApplication.clipboard")
     def test_clipboard_copy(self, mock_clipboard):
         # Настраиваем mock буфера обмена
@@ -83,5 +87,82 @@ class TestReport(unittest.TestCase):
         )
 
 
+class TestReportPayments(ReportTestCase):
+    """Список платежей произвольной длины: добавление, удаление полей и порядок Tab."""
+
+    def test_payments(self):
+        enter_text(self.window.EditClientsNDS, "122")
+        layout = self.window.layoutPaid
+
+        # Заполнение последнего поля платежа добавляет новое поле
+        enter_text(layout.itemAt(0).widget(), "30.50")
+        enter_text(layout.itemAt(1).widget(), "40")
+        self.assertEqual(layout.count(), 3)
+        self.assertEqual(self.window.paid, 70.5)
+        self.assertEqual(self.window.over, 9.5)
+
+        # Очищенное поле платежа удаляется
+        enter_text(layout.itemAt(0).widget(), "")
+        self.assertEqual(layout.count(), 2)
+        self.assertEqual(self.window.paid, 40.0)
+        self.assertEqual(self.window.left, 21.0)
+
+    def test_scroll_instead_of_squeeze(self):
+        window = self.window
+        layout = window.layoutPaid
+        for index in range(20):
+            enter_text(layout.itemAt(index).widget(), "1234567.89")
+        QApplication.processEvents()
+
+        # Поля не сжимаются ниже ширины суммы, список платежей прокручивается
+        for index in range(layout.count()):
+            line_edit = layout.itemAt(index).widget()
+            min_width = (
+                line_edit.fontMetrics().horizontalAdvance(C.TEXT_PAID_SAMPLE)
+                + C.PAID_WIDTH_MARGIN
+            )
+            self.assertEqual(line_edit.minimumWidth(), min_width)
+            self.assertEqual(line_edit.width(), min_width)
+            self.assertGreater(
+                line_edit.width(), line_edit.fontMetrics().horizontalAdvance("1234567.89")
+            )
+        self.assertTrue(window.scrollPaid.horizontalScrollBar().isVisible())
+
+    def test_tab_order(self):
+        window = self.window
+        layout = window.layoutPaid
+
+        def press_tab() -> QWidget:
+            QTest.keyClick(QApplication.focusWidget(), Qt.Key.Key_Tab)
+            QApplication.processEvents()
+            return QApplication.focusWidget()
+
+        # "Клиенты" -> первый платёж -> % НДС -> "Клиенты" (область прокрутки фокус не получает)
+        window.EditClientsNDS.setFocus()
+        self.assertIs(press_tab(), layout.itemAt(0).widget())
+        self.assertIs(press_tab(), window.EditPercent_NDS)
+        self.assertIs(press_tab(), window.EditClientsNDS)
+
+        # Tab из заполненного последнего поля переводит в новое поле платежа
+        window.EditClientsNDS.setFocus()
+        first = press_tab()
+        QTest.keyClicks(first, "10")
+        second = press_tab()
+        self.assertEqual(layout.count(), 2)
+        self.assertIs(second, layout.itemAt(1).widget())
+        self.assertIs(press_tab(), window.EditPercent_NDS)
+
+        # После удаления очищенного поля цепочка Tab не разрывается
+        second.setFocus()
+        QTest.keyClicks(second, "20")
+        self.assertIs(press_tab(), layout.itemAt(2).widget())
+        enter_text(layout.itemAt(0).widget(), "")
+        self.assertEqual(layout.count(), 2)
+        window.EditClientsNDS.setFocus()
+        self.assertIs(press_tab(), layout.itemAt(0).widget())
+        self.assertIs(press_tab(), layout.itemAt(1).widget())
+        self.assertIs(press_tab(), window.EditPercent_NDS)
+
+
 if __name__ == "__main__":
     unittest.main()
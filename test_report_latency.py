@@ -0,0 +1,27 @@
+import os
+import unittest
+
+from qt_harness import ReportTestCase, measure_latency, percentile
+
+# Параметры замера задаются переменными окружения (например, на CI)
+EDITS = int(os.environ.get("GALAXY_UI_EDITS", 2000))  # Количество правок
+BUDGET_P50_MS = float(os.environ.get("GALAXY_UI_BUDGET_P50_MS", 10.0))  # Бюджет медианы
+BUDGET_P99_MS = float(os.environ.get("GALAXY_UI_BUDGET_P99_MS", 50.0))  # Бюджет p99
+
+
+class TestReportLatency(ReportTestCase):
+    def test_focus_out_to_repaint_latency(self):
+        # Задержка "потеря фокуса -> перерисовка поля результата" не должна выходить за бюджет
+        # Для перцентилей нужно не менее 2 замеров
+        self.assertGreaterEqual(EDITS, 2, "GALAXY_UI_EDITS должно быть не меньше 2")
+        latencies = measure_latency(self.window, EDITS)
+        p50 = percentile(latencies, 50)
+        p99 = percentile(latencies, 99)
+        stats = f"{EDITS} правок: p50={p50:.3f} мс, p99={p99:.3f} мс"
+
+        self.assertLessEqual(p50, BUDGET_P50_MS, stats)
+        self.assertLessEqual(p99, BUDGET_P99_MS, stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLineEdit
 from PyQt6.QtGui import QRegularExpressionValidator
-from PyQt6.QtCore import QRegularExpression, pyqtSignal
+from PyQt6.QtCore import QRegularExpression, pyqtSignal, Qt
 
 from constants import Const as C
 
@@ -16,6 +16,8 @@ class ValidatedLineEdit(QLineEdit):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Причина последней потери фокуса (например, переход по Tab)
+        self.focus_out_reason = Qt.FocusReason.OtherFocusReason
         self.setValidator(
             QRegularExpressionValidator(QRegularExpression(C.RE_INPUT_DOUBLE))
         )
@@ -29,5 +31,6 @@ class ValidatedLineEdit(QLineEdit):
             # Устанавливает стиль поля ввода при невалидном значении.
             self.setStyleSheet(C.STYLE_ERROR)
         super().focusOutEvent(event)
+        self.focus_out_reason = event.reason()
         # noinspection PyUnresolvedReferences
         self.signal_focus_out.emit(self)